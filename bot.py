@@ -5,12 +5,12 @@
 #
 
 import argparse
+import datetime
 import os
 
 from dotenv import load_dotenv
 from loguru import logger
 
-from pipecat.audio.vad.silero import SileroVADAnalyzer
 from pipecat.audio.vad.vad_analyzer import VADParams
 from pipecat.pipeline.pipeline import Pipeline
 from pipecat.pipeline.runner import PipelineRunner
@@ -25,12 +25,18 @@ from pipecat.transports.network.fastapi_websocket import FastAPIWebsocketParams
 from pipecat.services.gemini_multimodal_live.gemini import InputParams
 from pipecat.services.gemini_multimodal_live.gemini import GeminiMultimodalModalities
 
+from event_loop import install_event_loop_policy
+from vad import SharedSileroVADAnalyzer, SilenceGate, TwoStageVAD, get_silero_session
+
 load_dotenv(override=True)
 
 PROJECT_ID=os.getenv("PROJECT_ID")
 MODEL=os.getenv("MODEL")
 LOCATION=os.getenv("LOCATION")
 
+# Load (and warm up) the VAD model now rather than on the first connection.
+get_silero_session()
+
 
 # Function handlers for the LLM
 search_tool = {"google_search": {}}
@@ -43,8 +49,13 @@ You can answer questions, provide information, and engage in casual conversation
 
 """
 
+# Opening turn sent on every connection. The template lives at module level
+# like `system_instruction`; only the date is filled in per connection. It
+# goes last to keep everything before it identical across sessions.
+greeting = "Start by greeting the user warmly, introducing yourself, and mentioning the current day. Be friendly and engaging to set a positive tone for the interaction. Today is {today}."
+
 
-# We store functions so objects (e.g. SileroVADAnalyzer) don't get
+# We store functions so objects (e.g. SharedSileroVADAnalyzer) don't get
 # instantiated. The function will be called when the desired transport gets
 # selected.
 transport_params = {
@@ -56,7 +67,9 @@ transport_params = {
         # of the Multimodal Live api, just to align events. This doesn't really
         # matter because we can only use the Multimodal Live API's phrase
         # endpointing, for now.
-        vad_analyzer=SileroVADAnalyzer(params=VADParams(stop_secs=0.5)),
+        vad_analyzer=SilenceGate(
+            TwoStageVAD(SharedSileroVADAnalyzer(params=VADParams(stop_secs=0.5)))
+        ),
     ),
     "webrtc": lambda: TransportParams(
         audio_in_enabled=True,
@@ -65,7 +78,9 @@ transport_params = {
         # of the Multimodal Live api, just to align events. This doesn't really
         # matter because we can only use the Multimodal Live API's phrase
         # endpointing, for now.
-        vad_analyzer=SileroVADAnalyzer(params=VADParams(stop_secs=0.5)),
+        vad_analyzer=SilenceGate(
+            TwoStageVAD(SharedSileroVADAnalyzer(params=VADParams(stop_secs=0.5)))
+        ),
     ),
 }
 
@@ -88,14 +103,8 @@ async def run_example(transport: BaseTransport, _: argparse.Namespace, handle_si
     )
 
 
-    context = OpenAILLMContext(
-        [
-            {
-                "role": "user",
-                "content": "Start by greeting the user warmly, introducing yourself, and mentioning the current day. Be friendly and engaging to set a positive tone for the interaction.",
-            }
-        ],
-    )
+    today = datetime.date.today().strftime("%A, %B %d, %Y")
+    context = OpenAILLMContext([{"role": "user", "content": greeting.format(today=today)}])
     context_aggregator = llm.create_context_aggregator(context)
 
     pipeline = Pipeline(
@@ -129,4 +138,6 @@ async def run_example(transport: BaseTransport, _: argparse.Namespace, handle_si
 if __name__ == "__main__":
     from pipecat.examples.run import main
 
+    install_event_loop_policy()
+
     main(run_example, transport_params=transport_params)
\ No newline at end of file
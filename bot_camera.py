@@ -7,11 +7,11 @@
 import argparse
 import asyncio
 import os
+from dataclasses import dataclass
 
 from dotenv import load_dotenv
 from loguru import logger
 
-from pipecat.audio.vad.silero import SileroVADAnalyzer
 from pipecat.audio.vad.vad_analyzer import VADParams
 from pipecat.examples.run import maybe_capture_participant_camera, maybe_capture_participant_screen
 from pipecat.pipeline.pipeline import Pipeline
@@ -28,14 +28,37 @@ from pipecat.transports.services.daily import DailyParams
 from pipecat.services.gemini_multimodal_live.gemini import InputParams
 from pipecat.services.gemini_multimodal_live.gemini import GeminiMultimodalModalities
 
+from event_loop import install_event_loop_policy
+from processors import BackpressureMonitor, FrameDownscale, LatestFrameOnly
+from vad import SharedSileroVADAnalyzer, SilenceGate, TwoStageVAD, get_silero_session
 
-load_dotenv(override=True)
 
 load_dotenv(override=True)
 
-PROJECT_ID=os.getenv("PROJECT_ID")
-MODEL=os.getenv("MODEL")
-LOCATION=os.getenv("LOCATION")
+
+@dataclass(frozen=True)
+class Cfg:
+    project_id: str
+    location: str
+    model: str
+
+    @classmethod
+    def from_env(cls) -> "Cfg":
+        values = {
+            "project_id": os.getenv("PROJECT_ID"),
+            "location": os.getenv("LOCATION"),
+            "model": os.getenv("MODEL"),
+        }
+        missing = [name.upper() for name, value in values.items() if not value]
+        if missing:
+            raise ValueError(f"Missing environment variables: {', '.join(missing)}")
+        return cls(**values)
+
+
+CFG = Cfg.from_env()
+
+# Load (and warm up) the VAD model now rather than on the first connection.
+get_silero_session()
 
 # Function handlers for the LLM
 search_tool = {"google_search": {}}
@@ -49,7 +72,12 @@ You can answer questions, provide information, and engage in casual conversation
 
 """
 
-# We store functions so objects (e.g. SileroVADAnalyzer) don't get
+# Opening turn sent on every connection. It doesn't change between clients,
+# so like `system_instruction` it lives at module level.
+greeting = "Say hello."
+
+
+# We store functions so objects (e.g. SharedSileroVADAnalyzer) don't get
 # instantiated. The function will be called when the desired transport gets
 # selected.
 transport_params = {
@@ -61,7 +89,10 @@ transport_params = {
         # of the Multimodal Live api, just to align events. This doesn't really
         # matter because we can only use the Multimodal Live API's phrase
         # endpointing, for now.
-        vad_analyzer=SileroVADAnalyzer(params=VADParams(stop_secs=0.5)),
+        vad_analyzer=SilenceGate(
+            TwoStageVAD(SharedSileroVADAnalyzer(params=VADParams(stop_secs=0.5))),
+            vad_max_windows=8,
+        ),
     ),
     "webrtc": lambda: TransportParams(
         audio_in_enabled=True,
@@ -71,7 +102,10 @@ transport_params = {
         # of the Multimodal Live api, just to align events. This doesn't really
         # matter because we can only use the Multimodal Live API's phrase
         # endpointing, for now.
-        vad_analyzer=SileroVADAnalyzer(params=VADParams(stop_secs=0.5)),
+        vad_analyzer=SilenceGate(
+            TwoStageVAD(SharedSileroVADAnalyzer(params=VADParams(stop_secs=0.5))),
+            vad_max_windows=8,
+        ),
     ),
 }
 
@@ -79,9 +113,9 @@ transport_params = {
 async def run_example(transport: BaseTransport, _: argparse.Namespace, handle_sigint: bool):
     llm = GeminiMultimodalLiveLLMService(
         api_key=None,
-        project_id=PROJECT_ID,
-        location=LOCATION,
-        model=MODEL,
+        project_id=CFG.project_id,
+        location=CFG.location,
+        model=CFG.model,
         tools=tools,
         voice_id="Aoede",
         system_instruction=system_instruction,
@@ -90,21 +124,21 @@ async def run_example(transport: BaseTransport, _: argparse.Namespace, handle_si
         params=InputParams(modalities=GeminiMultimodalModalities.AUDIO ,max_tokens=100 ),
     )
 
-    context = OpenAILLMContext(
-        [
-            {
-                "role": "user",
-                "content": "Say hello.",
-            },
-        ],
-    )
+    context = OpenAILLMContext([{"role": "user", "content": greeting}])
     context_aggregator = llm.create_context_aggregator(context)
 
+    # BackpressureMonitor reports each image the LLM has sent.
+    latest_frame_only = LatestFrameOnly(wait_for_delivery=True)
+    backpressure_monitor = BackpressureMonitor(latest_frame_only)
+
     pipeline = Pipeline(
         [
             transport.input(),
+            latest_frame_only,  # Drop stale camera/screen frames
+            FrameDownscale(),  # Send Gemini smaller images
             context_aggregator.user(),
             llm,
+            backpressure_monitor,  # Throttle video while the LLM lags
             transport.output(),
             context_aggregator.assistant(),
         ]
@@ -119,15 +153,26 @@ async def run_example(transport: BaseTransport, _: argparse.Namespace, handle_si
         ),
     )
 
+    session_ready = asyncio.Event()
+
+    @llm.event_handler("on_session_ready")
+    async def on_session_ready(llm):
+        session_ready.set()
+
     @transport.event_handler("on_client_connected")
     async def on_client_connected(transport, client):
         logger.info(f"Client connected: {client}")
 
+        # Capture stays at 1fps; BackpressureMonitor throttles through the
+        # LatestFrameOnly stride instead of re-subscribing the tracks.
         await maybe_capture_participant_camera(transport, client, framerate=1)
         await maybe_capture_participant_screen(transport, client, framerate=1)
 
         await task.queue_frames([context_aggregator.user().get_context_frame()])
-        await asyncio.sleep(3)
+        try:
+            await asyncio.wait_for(session_ready.wait(), timeout=3.0)
+        except asyncio.TimeoutError:
+            logger.warning("Gemini session not ready after 3s, unpausing anyway")
         logger.debug("Unpausing audio and video")
         llm.set_audio_input_paused(False)
         llm.set_video_input_paused(False)
@@ -145,4 +190,6 @@ async def run_example(transport: BaseTransport, _: argparse.Namespace, handle_si
 if __name__ == "__main__":
     from pipecat.examples.run import main
 
+    install_event_loop_policy()
+
     main(run_example, transport_params=transport_params)
\ No newline at end of file
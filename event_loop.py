@@ -0,0 +1,32 @@
+#
+# Copyright (c) 2024–2025, Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+import asyncio
+import os
+
+from loguru import logger
+
+
+def install_event_loop_policy():
+    """Selects the asyncio event loop the bots run on from `EVENT_LOOP`.
+
+    uvloop (the default) makes every websocket/socket read on the event loop
+    cheaper. EVENT_LOOP=rloop opts into rloop (experimental, a Rust loop on
+    top of mio, i.e. epoll/kqueue) and EVENT_LOOP=asyncio keeps the default
+    loop. Falls back to asyncio if the selected loop isn't installed.
+    """
+    event_loop = os.getenv("EVENT_LOOP", "uvloop").lower()
+    try:
+        if event_loop == "rloop":
+            import rloop
+
+            asyncio.set_event_loop_policy(rloop.EventLoopPolicy())
+        elif event_loop == "uvloop":
+            import uvloop
+
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        logger.warning(f"Event loop '{event_loop}' not available, using asyncio")
@@ -7,9 +7,9 @@
 
 import base64
 import io
-import json
 from typing import List, Literal, Optional
 
+import orjson
 from PIL import Image
 from pydantic import BaseModel, Field
 
@@ -144,7 +144,7 @@ class ServerEvent(BaseModel):
 
 def parse_server_event(str):
     try:
-        evt = json.loads(str)
+        evt = orjson.loads(str)
         return ServerEvent.model_validate(evt)
     except Exception as e:
         print(f"Error parsing server event: {e}")
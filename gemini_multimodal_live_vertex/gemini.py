@@ -6,12 +6,12 @@
 
 import asyncio
 import base64
-import json
 import time
 from dataclasses import dataclass
 from enum import Enum
 from typing import Any, Dict, List, Mapping, Optional, Union
 
+import orjson
 import websockets
 from loguru import logger
 from pydantic import BaseModel, Field
@@ -254,6 +254,8 @@ class GeminiMultimodalLiveLLMService(LLMService):
             "extra": params.extra if isinstance(params.extra, dict) else {},
         }
 
+        self._register_event_handler("on_session_ready")
+
     def can_generate_metrics(self) -> bool:
         return True
 
@@ -462,7 +464,13 @@ class GeminiMultimodalLiveLLMService(LLMService):
             #uri = f"wss://{self.base_url}/ws/google.ai.generativelanguage.v1alpha.GenerativeService.BidiGenerateContent?key={self.api_key}"
             uri = f"wss://{self.base_url}/ws/google.cloud.aiplatform.v1beta1.LlmBidiService/BidiGenerateContent"
             logger.info(f"Connecting to {uri}")
-            self._websocket = await websockets.connect(uri=uri, additional_headers={"Authorization": f"Bearer {bearer_token}"})
+            # Frames are JSON with base64 media that barely compresses, so skip
+            # permessage-deflate and its per-frame zlib work in both directions.
+            self._websocket = await websockets.connect(
+                uri=uri,
+                additional_headers={"Authorization": f"Bearer {bearer_token}"},
+                compression=None,
+            )
             self._receive_task = self.create_task(self._receive_task_handler())
             self._transcribe_audio_task = self.create_task(self._transcribe_audio_handler())
             self._transcribe_model_audio_task = self.create_task(
@@ -550,7 +558,7 @@ class GeminiMultimodalLiveLLMService(LLMService):
         # logger.debug(f"Sending message to websocket: {message}")
         try:
             if self._websocket:
-                await self._websocket.send(json.dumps(message))
+                await self._websocket.send(orjson.dumps(message).decode())
         except Exception as e:
             if self._disconnecting:
                 return
@@ -699,8 +707,8 @@ class GeminiMultimodalLiveLLMService(LLMService):
         # will work until we revisit that.
         call_id = tool_result_message.get("tool_call_id")
         name = tool_result_message.get("tool_call_name")
-        result = json.loads(tool_result_message.get("content") or "")
-        response_message = json.dumps(
+        result = orjson.loads(tool_result_message.get("content") or "")
+        response_message = orjson.dumps(
             {
                 "toolResponse": {
                     "functionResponses": [
@@ -714,7 +722,7 @@ class GeminiMultimodalLiveLLMService(LLMService):
                     ],
                 }
             }
-        )
+        ).decode()
         await self._websocket.send(response_message)
         # await self._websocket.send(json.dumps({"clientContent": {"turnComplete": True}}))
 
@@ -728,6 +736,7 @@ class GeminiMultimodalLiveLLMService(LLMService):
             self._setup_start_time = None
 
         self._api_session_ready = True
+        await self._call_event_handler("on_session_ready")
         # Now that we've configured the session, we can run the LLM if we need to.
         if self._run_llm_when_api_session_ready:
             self._run_llm_when_api_session_ready = False
@@ -805,13 +814,13 @@ class GeminiMultimodalLiveLLMService(LLMService):
         
         function_responses = rebuttals_tool.process_rebuttal_tool_call(tool_calls, self._call_variable)
 
-        response_message = json.dumps(
+        response_message = orjson.dumps(
             {
                 "toolResponse": {
                     "functionResponses": function_responses,
                 }
             }
-        )
+        ).decode()
         logger.info(response_message)
         await self._websocket.send(response_message)
         logger.debug("[Local Logic] Sent tool responses to Gemini.")
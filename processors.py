@@ -0,0 +1,232 @@
+#
+# Copyright (c) 2024–2025, Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+import asyncio
+import time
+from collections import deque
+from typing import Deque, Dict, Optional, Tuple
+
+from loguru import logger
+from PIL import Image
+
+from pipecat.frames.frames import (
+    CancelFrame,
+    EndFrame,
+    Frame,
+    InputImageRawFrame,
+    StartFrame,
+    TTSAudioRawFrame,
+    TTSStartedFrame,
+    TTSStoppedFrame,
+)
+from pipecat.processors.frame_processor import FrameDirection, FrameProcessor
+
+
+class LatestFrameOnly(FrameProcessor):
+    """Forwards only the most recent image of each video source.
+
+    Every source (participant camera, participant screen, ...) gets a
+    single-slot queue, and a new image replaces whatever is still waiting in
+    its slot. Everything that isn't an image passes straight through.
+
+    Pushing downstream never blocks, so by default images are forwarded as
+    soon as they arrive. With `wait_for_delivery=True` an image is only
+    forwarded once the previous one has been delivered, so when downstream
+    stalls the backlog is dropped instead of being delivered late. Something
+    downstream has to report deliveries with `frame_delivered()` (e.g.
+    `BackpressureMonitor` after the LLM), otherwise every image waits
+    `delivery_timeout` seconds and is then forwarded anyway.
+
+    With `set_frame_stride(n)` only every n-th image of each source is
+    accepted at all, which is how `BackpressureMonitor` sheds video load.
+    """
+
+    def __init__(
+        self, *, wait_for_delivery: bool = False, delivery_timeout: float = 2.0, **kwargs
+    ):
+        super().__init__(**kwargs)
+        self._wait_for_delivery = wait_for_delivery
+        self._delivery_timeout = delivery_timeout
+        self._queues: Dict[Tuple[str, Optional[str]], asyncio.Queue] = {}
+        self._frame_counts: Dict[Tuple[str, Optional[str]], int] = {}
+        self._frame_stride = 1
+        self._frame_available = asyncio.Event()
+        self._frame_delivered = asyncio.Event()
+        self._frame_delivered.set()
+        self._forward_task = None
+
+        self._dropped = 0
+        self._last_report_time = 0.0
+
+    async def process_frame(self, frame: Frame, direction: FrameDirection):
+        await super().process_frame(frame, direction)
+
+        if isinstance(frame, StartFrame):
+            await self.push_frame(frame, direction)
+            self._forward_task = self.create_task(self._forward_task_handler())
+        elif isinstance(frame, (EndFrame, CancelFrame)):
+            await self._cancel_forward_task()
+            await self.push_frame(frame, direction)
+        elif isinstance(frame, InputImageRawFrame) and direction == FrameDirection.DOWNSTREAM:
+            self._put_latest(frame)
+        else:
+            await self.push_frame(frame, direction)
+
+    async def cleanup(self):
+        await super().cleanup()
+        await self._cancel_forward_task()
+
+    def set_frame_stride(self, stride: int):
+        self._frame_stride = max(1, stride)
+
+    def frame_delivered(self):
+        self._frame_delivered.set()
+
+    def _put_latest(self, frame: InputImageRawFrame):
+        source = (getattr(frame, "user_id", ""), frame.transport_source)
+
+        count = self._frame_counts.get(source, 0)
+        self._frame_counts[source] = count + 1
+        if count % self._frame_stride:
+            self._dropped += 1
+            self._maybe_report_dropped()
+            return
+
+        queue = self._queues.get(source)
+        if not queue:
+            queue = asyncio.Queue(maxsize=1)
+            self._queues[source] = queue
+
+        try:
+            queue.put_nowait(frame)
+        except asyncio.QueueFull:
+            queue.get_nowait()
+            queue.put_nowait(frame)
+            self._dropped += 1
+            self._maybe_report_dropped()
+
+        self._frame_available.set()
+
+    def _maybe_report_dropped(self):
+        now = time.time()
+        if now - self._last_report_time < 1:
+            return
+        logger.debug(f"{self}: dropped {self._dropped} stale video frames")
+        self._last_report_time = now
+        self._dropped = 0
+
+    async def _cancel_forward_task(self):
+        if self._forward_task:
+            await self.cancel_task(self._forward_task)
+            self._forward_task = None
+
+    async def _forward_task_handler(self):
+        while True:
+            await self._frame_available.wait()
+            self._frame_available.clear()
+            for queue in self._queues.values():
+                if queue.empty():
+                    continue
+                if self._wait_for_delivery:
+                    await self._wait_frame_delivered()
+                    # Taken after the wait, so this is the newest image of the source.
+                    self._frame_delivered.clear()
+                await self.push_frame(queue.get_nowait())
+
+    async def _wait_frame_delivered(self):
+        try:
+            await asyncio.wait_for(self._frame_delivered.wait(), timeout=self._delivery_timeout)
+        except asyncio.TimeoutError:
+            logger.warning(
+                f"{self}: previous image not delivered after {self._delivery_timeout}s, "
+                "forwarding the next one anyway"
+            )
+
+
+class FrameDownscale(FrameProcessor):
+    """Shrinks input images so their longest side is at most `max_size` pixels.
+
+    Images keep their aspect ratio and pixel format. Smaller images go through
+    as they are.
+    """
+
+    def __init__(self, *, max_size: int = 512, **kwargs):
+        super().__init__(**kwargs)
+        self._max_size = max_size
+
+    async def process_frame(self, frame: Frame, direction: FrameDirection):
+        await super().process_frame(frame, direction)
+
+        if isinstance(frame, InputImageRawFrame) and max(frame.size) > self._max_size:
+            image = Image.frombytes(frame.format, frame.size, frame.image)
+            image.thumbnail((self._max_size, self._max_size), Image.Resampling.BILINEAR)
+            frame.image = image.tobytes()
+            frame.size = image.size
+
+        await self.push_frame(frame, direction)
+
+
+class BackpressureMonitor(FrameProcessor):
+    """Throttles video input while the LLM's audio output is stalling.
+
+    Gemini streams a response faster than real time, so long gaps between
+    consecutive bot audio frames of the same response mean the LLM (or the
+    network to it) is falling behind. When the p95 of the recent gaps goes
+    over `latency_threshold` seconds, `frame_gate` is told to only accept
+    every other image. Full rate comes back once the p95 is under it again.
+
+    It also tells `frame_gate` when an image has made it past the LLM, so the
+    gate knows it can forward the next one.
+    """
+
+    def __init__(
+        self,
+        frame_gate: LatestFrameOnly,
+        *,
+        latency_threshold: float = 0.5,
+        window_size: int = 50,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        self._frame_gate = frame_gate
+        self._latency_threshold = latency_threshold
+        self._gaps: Deque[float] = deque(maxlen=window_size)
+        self._last_audio_time: Optional[float] = None
+        self._degraded = False
+
+    async def process_frame(self, frame: Frame, direction: FrameDirection):
+        await super().process_frame(frame, direction)
+
+        if isinstance(frame, (TTSStartedFrame, TTSStoppedFrame)):
+            # Only measure gaps within a response, not the silence between them.
+            self._last_audio_time = None
+        elif isinstance(frame, TTSAudioRawFrame):
+            now = time.monotonic()
+            if self._last_audio_time is not None:
+                self._gaps.append(now - self._last_audio_time)
+                self._update_gate()
+            self._last_audio_time = now
+        elif isinstance(frame, InputImageRawFrame):
+            # The LLM pushes images on only after it has sent them.
+            self._frame_gate.frame_delivered()
+
+        await self.push_frame(frame, direction)
+
+    def _update_gate(self):
+        gaps = sorted(self._gaps)
+        p95 = gaps[int(0.95 * (len(gaps) - 1))]
+
+        degraded = p95 > self._latency_threshold
+        if degraded == self._degraded:
+            return
+
+        self._degraded = degraded
+        if degraded:
+            logger.warning(f"{self}: LLM output p95 gap {p95:.3f}s, throttling video input")
+            self._frame_gate.set_frame_stride(2)
+        else:
+            logger.info(f"{self}: LLM output p95 gap {p95:.3f}s, restoring video input")
+            self._frame_gate.set_frame_stride(1)
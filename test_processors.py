@@ -0,0 +1,64 @@
+import asyncio
+
+import pytest
+
+from pipecat.frames.frames import InputImageRawFrame
+from pipecat.utils.asyncio import TaskManager
+from processors import LatestFrameOnly
+
+
+def image(color: int) -> InputImageRawFrame:
+    return InputImageRawFrame(image=bytes([color] * 3), size=(1, 1), format="RGB")
+
+
+def start_gate(monkeypatch, gate: LatestFrameOnly) -> list:
+    gate._task_manager = TaskManager()
+    gate._task_manager.set_event_loop(asyncio.get_running_loop())
+
+    forwarded = []
+
+    async def push_frame(frame, direction=None):
+        forwarded.append(frame)
+
+    monkeypatch.setattr(gate, "push_frame", push_frame)
+    # Normally started on StartFrame.
+    gate._forward_task = gate.create_task(gate._forward_task_handler())
+    return forwarded
+
+
+@pytest.mark.asyncio
+async def test_latest_frame_only_forwards_without_waiting(monkeypatch):
+    gate = LatestFrameOnly()
+    forwarded = start_gate(monkeypatch, gate)
+
+    first, second = image(1), image(2)
+    gate._put_latest(first)
+    await asyncio.sleep(0.01)
+    gate._put_latest(second)
+    await asyncio.sleep(0.01)
+    assert forwarded == [first, second]
+
+    await gate._cancel_forward_task()
+
+
+@pytest.mark.asyncio
+async def test_latest_frame_only_waits_for_delivery(monkeypatch):
+    gate = LatestFrameOnly(wait_for_delivery=True, delivery_timeout=5)
+    forwarded = start_gate(monkeypatch, gate)
+
+    first, stale, latest = image(1), image(2), image(3)
+    gate._put_latest(first)
+    await asyncio.sleep(0.01)
+    assert forwarded == [first]
+
+    # Nothing goes out while the first image is still on its way.
+    gate._put_latest(stale)
+    gate._put_latest(latest)
+    await asyncio.sleep(0.01)
+    assert forwarded == [first]
+
+    gate.frame_delivered()
+    await asyncio.sleep(0.01)
+    assert forwarded == [first, latest]
+
+    await gate._cancel_forward_task()
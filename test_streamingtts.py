@@ -0,0 +1,98 @@
+import asyncio
+
+import pytest
+from google.cloud import texttospeech
+
+from pipecat.frames.frames import ErrorFrame, TTSStartedFrame
+from pipecat.utils.asyncio import TaskManager
+from streamingtts import GoogleTTSService
+
+
+def create_tts(monkeypatch, voice_id: str) -> GoogleTTSService:
+    # No credentials in tests, the config request doesn't need a client.
+    monkeypatch.setattr(GoogleTTSService, "_create_client", lambda self, *args: None)
+    tts = GoogleTTSService(voice_id=voice_id, sample_rate=24000)
+    # Normally set by start().
+    tts._sample_rate = 24000
+    return tts
+
+
+def test_config_request_linear16(monkeypatch):
+    tts = create_tts(monkeypatch, "en-US-Neural2-A")
+
+    config = tts._get_config_request().streaming_config
+    assert config.voice.name == "en-US-Neural2-A"
+    assert config.voice.language_code == "en-US"
+    assert config.streaming_audio_config.audio_encoding == texttospeech.AudioEncoding.LINEAR16
+    assert config.streaming_audio_config.sample_rate_hertz == 24000
+
+
+def test_config_request_chirp3_default_audio(monkeypatch):
+    tts = create_tts(monkeypatch, "en-US-Chirp3-HD-Charon")
+
+    config = tts._get_config_request().streaming_config
+    assert config.voice.name == "en-US-Chirp3-HD-Charon"
+    assert "streaming_audio_config" not in config
+
+
+class GrpcLikeClient:
+    # Like grpc.aio: requests are consumed by a separate task, which cancels
+    # the call if the request iterator raises, and reading the responses of a
+    # cancelled call raises CancelledError.
+    async def streaming_synthesize(self, requests):
+        failed = asyncio.Event()
+
+        async def consume():
+            try:
+                async for _ in requests:
+                    pass
+            except Exception:
+                failed.set()
+
+        self.consumer = asyncio.create_task(consume())
+
+        async def responses():
+            await failed.wait()
+            raise asyncio.CancelledError()
+            yield
+
+        return responses()
+
+
+@pytest.mark.asyncio
+async def test_request_build_error_yields_error_frame(monkeypatch):
+    tts = create_tts(monkeypatch, "en-US-Neural2-A")
+    tts._client = GrpcLikeClient()
+    tts._task_manager = TaskManager()
+    tts._task_manager.set_event_loop(asyncio.get_running_loop())
+
+    def construct_ssml(text):
+        raise RuntimeError("invalid SSML")
+
+    monkeypatch.setattr(tts, "_construct_ssml", construct_ssml)
+
+    async def collect():
+        return [frame async for frame in tts.run_tts("Hello there.")]
+
+    frames = await asyncio.wait_for(collect(), timeout=5)
+    assert isinstance(frames[0], TTSStartedFrame)
+    assert isinstance(frames[-1], ErrorFrame)
+    assert "invalid SSML" in frames[-1].error
+
+    # A real cancellation on the next call isn't mistaken for that error.
+    async def start_ttfb_metrics():
+        raise asyncio.CancelledError()
+
+    monkeypatch.setattr(tts, "start_ttfb_metrics", start_ttfb_metrics)
+
+    with pytest.raises(asyncio.CancelledError):
+        await asyncio.wait_for(collect(), timeout=5)
+
+
+def test_ssml_without_service_language(monkeypatch):
+    tts = create_tts(monkeypatch, "en-US-Neural2-A")
+    # e.g. a Language without a Google TTS mapping
+    tts._settings["language"] = None
+
+    ssml = tts._construct_ssml("Tom & Jerry")
+    assert ssml == "<speak><voice name='en-US-Neural2-A'>Tom &amp; Jerry</voice></speak>"
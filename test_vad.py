@@ -0,0 +1,99 @@
+import numpy as np
+
+from pipecat.audio.vad.vad_analyzer import VADAnalyzer, VADParams, VADState
+from vad import SilenceGate, TwoStageVAD
+
+SAMPLE_RATE = 16000
+WINDOW = 512
+
+
+class FakeSilero(VADAnalyzer):
+    def __init__(self):
+        super().__init__(sample_rate=SAMPLE_RATE, params=VADParams(min_volume=0))
+        self.speech = False
+
+    def num_frames_required(self) -> int:
+        return WINDOW
+
+    def voice_confidence(self, buffer) -> float:
+        return 1.0 if self.speech else 0.0
+
+
+def noise(rng):
+    return rng.normal(0, 300, WINDOW).astype(np.int16).tobytes()
+
+
+def voice():
+    t = np.arange(WINDOW) / SAMPLE_RATE
+    return (8000 * np.sin(2 * np.pi * 300 * t)).astype(np.int16).tobytes()
+
+
+def test_gate_shares_state_with_two_stage():
+    rng = np.random.default_rng(0)
+    silero = FakeSilero()
+    two_stage = TwoStageVAD(silero)
+    gate = SilenceGate(two_stage)
+    gate.set_sample_rate(SAMPLE_RATE)
+
+    for _ in range(20):
+        assert gate.analyze_audio(noise(rng)) == VADState.QUIET
+
+    silero.speech = True
+    for _ in range(20):
+        state = gate.analyze_audio(voice())
+    assert state == VADState.SPEAKING
+    assert two_stage._vad_state == VADState.SPEAKING
+
+    # Silero disagreeing in the middle of an utterance must not drag the
+    # noise floor towards the user's voice.
+    noise_floor = two_stage._noise_floor.copy()
+    silero.speech = False
+    gate.analyze_audio(voice())
+    np.testing.assert_array_equal(two_stage._noise_floor, noise_floor)
+
+
+def test_gate_drains_up_to_max_windows():
+    gate = SilenceGate(TwoStageVAD(FakeSilero()), vad_max_windows=4)
+    gate.set_sample_rate(SAMPLE_RATE)
+
+    # 6 windows in a single frame: 4 go through now, the rest on the next call.
+    gate.analyze_audio(voice() * 6)
+    assert len(gate._vad_buffer) == 2 * gate._vad_frames_num_bytes
+    gate.analyze_audio(b"")
+    assert len(gate._vad_buffer) == 0
+
+
+def test_gate_forwards_params():
+    silero = FakeSilero()
+    gate = SilenceGate(silero)
+    gate.set_sample_rate(SAMPLE_RATE)
+
+    params = VADParams(confidence=0.9, min_volume=0.2)
+    gate.set_params(params)
+    assert silero.params == params
+
+
+def test_two_stage_forwards_params():
+    silero = FakeSilero()
+    two_stage = TwoStageVAD(silero)
+    two_stage.set_sample_rate(SAMPLE_RATE)
+
+    params = VADParams(confidence=0.9, min_volume=0.2)
+    two_stage.set_params(params)
+    assert two_stage.params == params
+    assert silero.params == params
+
+
+def test_two_stage_does_not_seed_noise_floor_from_speech():
+    silero = FakeSilero()
+    two_stage = TwoStageVAD(silero)
+    two_stage.set_sample_rate(SAMPLE_RATE)
+
+    # The user is already talking when the first window arrives.
+    silero.speech = True
+    assert two_stage.voice_confidence(voice()) == 1.0
+    assert two_stage._noise_floor is None
+
+    silero.speech = False
+    two_stage.voice_confidence(noise(np.random.default_rng(0)))
+    assert two_stage._noise_floor is not None
@@ -0,0 +1,243 @@
+#
+# Copyright (c) 2024–2025, Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+from importlib import resources
+from typing import Optional
+
+import numpy as np
+import onnxruntime
+from loguru import logger
+
+from pipecat.audio.vad.silero import SileroOnnxModel, SileroVADAnalyzer
+from pipecat.audio.vad.vad_analyzer import VADAnalyzer, VADParams, VADState
+
+# Lowest frequency considered by the band-energy pre-filter. Below this it's
+# mostly mains hum and handling noise, not speech.
+_MIN_BAND_HZ = 100.0
+
+# Keeps log(e / nf) finite on digital silence.
+_EPSILON = 1e-6
+
+_SILERO_SESSION: Optional[onnxruntime.InferenceSession] = None
+
+
+def get_silero_session() -> onnxruntime.InferenceSession:
+    """Returns the process-wide Silero ONNX session, loading it on first use.
+
+    The model weights are read-only, so every analyzer can run on the same
+    session. Only the recurrent state is per stream.
+    """
+    global _SILERO_SESSION
+
+    if _SILERO_SESSION is None:
+        logger.debug("Loading shared Silero VAD model...")
+        model_path = resources.files("pipecat.audio.vad.data").joinpath("silero_vad.onnx")
+
+        # Single-threaded, VAD windows are tiny and the asyncio loop shares
+        # the CPU with us.
+        opts = onnxruntime.SessionOptions()
+        opts.inter_op_num_threads = 1
+        opts.intra_op_num_threads = 1
+
+        _SILERO_SESSION = onnxruntime.InferenceSession(
+            str(model_path), sess_options=opts, providers=["CPUExecutionProvider"]
+        )
+
+        # The first run() sets up kernels and allocator arenas and pages the
+        # weights in. Pay for that here instead of on the user's first words.
+        _SILERO_SESSION.run(
+            None,
+            {
+                "input": np.zeros((1, 64 + 512), dtype=np.float32),
+                "state": np.zeros((2, 1, 128), dtype=np.float32),
+                "sr": np.array(16000, dtype=np.int64),
+            },
+        )
+        logger.debug("Loaded shared Silero VAD")
+
+    return _SILERO_SESSION
+
+
+class _SharedSileroOnnxModel(SileroOnnxModel):
+    def __init__(self, session: onnxruntime.InferenceSession):
+        self.session = session
+        self.reset_states()
+        self.sample_rates = [8000, 16000]
+
+
+def _analyze_windows(analyzer: VADAnalyzer, buffer, max_windows: int) -> VADState:
+    # The base analyzer consumes a single window per call. Keep going while
+    # there are complete windows buffered so the reported state doesn't lag
+    # behind the audio when frames are larger than a window.
+    state = VADAnalyzer.analyze_audio(analyzer, buffer)
+    for _ in range(max_windows - 1):
+        if len(analyzer._vad_buffer) < analyzer._vad_frames_num_bytes:
+            break
+        state = VADAnalyzer.analyze_audio(analyzer, b"")
+    return state
+
+
+class SharedSileroVADAnalyzer(SileroVADAnalyzer):
+    """Silero analyzer running on a shared ONNX session.
+
+    `SileroVADAnalyzer` loads the model into a new session for every
+    instance. This one only allocates the per-stream state and runs on
+    `session` (the process-wide one from `get_silero_session()` by default).
+    """
+
+    def __init__(
+        self,
+        session: Optional[onnxruntime.InferenceSession] = None,
+        *,
+        sample_rate: Optional[int] = None,
+        params: VADParams = VADParams(),
+    ):
+        # Skip SileroVADAnalyzer.__init__(), that's the one loading the model.
+        VADAnalyzer.__init__(self, sample_rate=sample_rate, params=params)
+        self._model = _SharedSileroOnnxModel(session or get_silero_session())
+        self._last_reset_time = 0
+
+
+class SilenceGate(VADAnalyzer):
+    """Skips the wrapped analyzer on windows with a peak amplitude below `threshold`.
+
+    This catches digital silence and a quiet room (e.g. before the user first
+    speaks) with a single vectorized min/max over the int16 samples, before
+    any FFT or model inference. Each `analyze_audio()` call goes through up
+    to `vad_max_windows` buffered windows.
+    """
+
+    def __init__(self, analyzer: VADAnalyzer, *, threshold: int = 200, vad_max_windows: int = 1):
+        super().__init__(sample_rate=analyzer._init_sample_rate, params=analyzer.params)
+        self._analyzer = analyzer
+        self._threshold = threshold
+        self._vad_max_windows = vad_max_windows
+
+    def set_sample_rate(self, sample_rate: int):
+        self._analyzer.set_sample_rate(sample_rate)
+        super().set_sample_rate(sample_rate)
+
+    def set_params(self, params: VADParams):
+        # The transport only updates the outermost analyzer.
+        self._analyzer.set_params(params)
+        super().set_params(params)
+
+    def num_frames_required(self) -> int:
+        return self._analyzer.num_frames_required()
+
+    def analyze_audio(self, buffer) -> VADState:
+        return _analyze_windows(self, buffer, self._vad_max_windows)
+
+    def voice_confidence(self, buffer) -> float:
+        samples = np.frombuffer(buffer, dtype=np.int16)
+        # Compare max and -min instead of abs(): no temporary array and no
+        # overflow on -32768.
+        if max(int(samples.max()), -int(samples.min())) < self._threshold:
+            return 0.0
+        # Only our own analyze_audio() runs the state machine. Hand the state
+        # to the wrapped analyzer, e.g. TwoStageVAD needs it to know whether
+        # the user is in the middle of an utterance.
+        self._analyzer._vad_state = self._vad_state
+        return self._analyzer.voice_confidence(buffer)
+
+
+class TwoStageVAD(VADAnalyzer):
+    """Band-energy pre-filter in front of a Silero VAD analyzer.
+
+    Stage 1 splits each analysis window into log-spaced frequency bands and
+    scores it against a per-band noise floor tracked with an EMA over silent
+    windows. Only windows scoring above `threshold` are handed to the wrapped
+    Silero analyzer (stage 2), so long silences never reach the ONNX session.
+    Each `analyze_audio()` call goes through up to `vad_max_windows` buffered
+    windows.
+    """
+
+    def __init__(
+        self,
+        silero: SileroVADAnalyzer,
+        *,
+        threshold: float = 3.0,
+        num_bands: int = 8,
+        noise_floor_alpha: float = 0.01,
+        vad_max_windows: int = 1,
+    ):
+        super().__init__(sample_rate=silero._init_sample_rate, params=silero.params)
+        self._silero = silero
+        self._threshold = threshold
+        self._num_bands = num_bands
+        self._noise_floor_alpha = noise_floor_alpha
+        self._vad_max_windows = vad_max_windows
+
+        self._band_edges: Optional[np.ndarray] = None
+        self._noise_floor: Optional[np.ndarray] = None
+
+    #
+    # VADAnalyzer
+    #
+
+    def set_sample_rate(self, sample_rate: int):
+        # Silero validates the sample rate and decides the window size, so it
+        # needs to be configured before our own params are computed.
+        self._silero.set_sample_rate(sample_rate)
+        super().set_sample_rate(sample_rate)
+
+        num_frames = self.num_frames_required()
+        num_bins = num_frames // 2 + 1
+        min_bin = max(1, int(_MIN_BAND_HZ * num_frames / self.sample_rate))
+        edges = np.geomspace(min_bin, num_bins, self._num_bands + 1).astype(np.int64)
+        self._band_edges = np.unique(edges)
+        self._noise_floor = None
+
+    def set_params(self, params: VADParams):
+        # The transport only updates the outermost analyzer.
+        self._silero.set_params(params)
+        super().set_params(params)
+
+    def num_frames_required(self) -> int:
+        return self._silero.num_frames_required()
+
+    def analyze_audio(self, buffer) -> VADState:
+        return _analyze_windows(self, buffer, self._vad_max_windows)
+
+    def voice_confidence(self, buffer) -> float:
+        energies = self._band_energies(buffer)
+
+        if self._noise_floor is None:
+            # Only seed the floor from a window Silero agrees is not speech,
+            # otherwise a user already talking would become the "background".
+            confidence = self._silero.voice_confidence(buffer)
+            if confidence < self._params.confidence:
+                self._noise_floor = energies
+            return confidence
+
+        score = float(np.maximum(0.0, np.log(energies / self._noise_floor)).sum())
+        if score < self._threshold:
+            self._update_noise_floor(energies)
+            return 0.0
+
+        confidence = self._silero.voice_confidence(buffer)
+
+        # Silero disagreed with stage 1 and we are not in the middle of an
+        # utterance: this is background, let the noise floor follow it.
+        if confidence < self._params.confidence and self._vad_state == VADState.QUIET:
+            self._update_noise_floor(energies)
+
+        return confidence
+
+    #
+    # Stage 1
+    #
+
+    def _band_energies(self, buffer) -> np.ndarray:
+        samples = np.frombuffer(buffer, dtype=np.int16).astype(np.float32)
+        power = np.square(np.abs(np.fft.rfft(samples)))
+        edges = self._band_edges
+        return np.add.reduceat(power[: edges[-1]], edges[:-1]) + _EPSILON
+
+    def _update_noise_floor(self, energies: np.ndarray):
+        alpha = self._noise_floor_alpha
+        self._noise_floor = (1.0 - alpha) * self._noise_floor + alpha * energies
+